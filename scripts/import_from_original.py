@@ -3,18 +3,42 @@
 
 from __future__ import annotations
 
+import argparse
+import functools
 import json
+import os
 import re
+import string
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 from urllib.parse import urlparse
 
 import yaml
 
+# the pure-Python SafeDumper wraps long escaped non-ASCII strings at different points, so the
+# committed files are only reproducible with the libyaml emitter
+if not yaml.__with_libyaml__:
+    sys.exit("import_from_original.py requires PyYAML built with libyaml (yaml.CSafeDumper)")
+from yaml import CSafeDumper as YamlDumper
+
+try:
+    import ijson
+except ImportError:  # optional; fall back to loading the whole document
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module produces the same bytes
+    orjson = None
+
 ROOT = Path(__file__).resolve().parent.parent
 SOURCE_JSON = ROOT.parent / "SecCertRoadmap" / "data" / "certificates.json"
 TARGET_DIR = ROOT / "data" / "certifications"
 INDEX_FILE = ROOT / "data" / "index.yaml"
+SIDECAR_FILE = ROOT / "data" / "certifications.index.json"
 TODAY = "2026-02-27"
 
 DOMAIN_LAYOUT = [
@@ -129,26 +153,81 @@ SUBAREA_TO_ROLE = {
     "Exploitation": ["exploit-developer"],
 }
 
+TRACK_MAP = {
+    "Communication and Network Security": "communication-network-security",
+    "IAM": "iam",
+    "Security Architecture and Engineering": "security-architecture-and-engineering",
+    "Asset Security": "asset-security",
+    "Security and Risk Management": "security-and-risk-management",
+    "Security Assessment and Testing": "security-assessment-and-testing",
+    "Software Security": "software-security",
+    "Security Operations": "security-operations",
+}
+
+SUB_TRACK_MAP = {
+    "Cloud/SysOps": "cloud-sysops",
+    "*nix": "nix",
+    "ICS/IoT": "ics-iot",
+    "GRC": "grc",
+    "Forensics": "forensics",
+    "Incident Handling": "incident-handling",
+    "Penetration Testing": "penetration-testing",
+    "Exploitation": "exploitation",
+}
+
+AI_KEYWORDS = (" ai", "machine learning", "ml ", "llm", "model", "iso42001", "iso/iec 42001", "aigp")
+AI_KEYWORDS_RE = re.compile("|".join(re.escape(keyword) for keyword in AI_KEYWORDS))
+# zero-width lookahead so overlapping keywords (e.g. "coursexam") are all reported
+DELIVERY_RE = re.compile(r"(?=(interview|lab|exam|course))")
+
+# non-ASCII characters are encoded as "?" first, so every byte outside [a-z0-9] becomes "-"
+SLUG_TABLE = bytes(c if chr(c) in string.ascii_lowercase + string.digits else ord("-") for c in range(256))
+WHITESPACE_RE = re.compile(r"\s+")
+PRICE_HINT_RE = re.compile(r"(\$|€|£|free|subscription|travel|member|exam)", re.IGNORECASE)
+PRICE_AMOUNT_RE = re.compile(r"\$\s*([0-9][0-9,]*(?:\.[0-9]+)?)")
+
 
 def slugify(value: str) -> str:
-    value = value.lower().strip()
-    value = re.sub(r"[^a-z0-9]+", "-", value)
-    value = value.strip("-")
-    return value or "cert"
+    value = value.lower().encode("ascii", "replace").translate(SLUG_TABLE).decode("ascii")
+    return "-".join(part for part in value.split("-") if part) or "cert"
+
 
+@functools.lru_cache(maxsize=None)
+def slug_label(value: str) -> str:
+    # tags and tracks come from a small category vocabulary; slugify each label once
+    # and share one string object per label across all records
+    return sys.intern(slugify(value))
 
-def unique_id(base: str, used: set[str]) -> str:
+
+def unique_id(base: str, used: Dict[str, int]) -> str:
+    # used maps every taken id to the next suffix to try when it recurs as a base
     if base not in used:
-        used.add(base)
+        used[base] = 2
         return base
-    idx = 2
+    idx = used[base]
     while f"{base}-{idx}" in used:
         idx += 1
     candidate = f"{base}-{idx}"
-    used.add(candidate)
+    used[base] = idx + 1
+    used[candidate] = 2
     return candidate
 
 
+def build_provider_trie(host_map: Dict[str, str]) -> Dict:
+    # reversed host labels (com -> hackthebox -> academy); a node's provider sits under the None key
+    trie: Dict = {}
+    for host, provider in host_map.items():
+        node = trie
+        for label in reversed(host.split(".")):
+            node = node.setdefault(label, {})
+        node[None] = provider
+    return trie
+
+
+PROVIDER_TRIE = build_provider_trie(HOST_PROVIDER_MAP)
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_provider(url: str) -> str:
     try:
         host = urlparse(url).netloc.lower()
@@ -157,11 +236,17 @@ def parse_provider(url: str) -> str:
 
     host = host.replace("www.", "")
 
-    for key, provider in HOST_PROVIDER_MAP.items():
-        if host == key or host.endswith(f".{key}"):
-            return provider
-
     parts = host.split(".")
+    node = PROVIDER_TRIE
+    provider = None
+    for label in reversed(parts):
+        node = node.get(label)
+        if node is None:
+            break
+        provider = node.get(None, provider)
+    if provider is not None:
+        return provider
+
     if len(parts) >= 2:
         base = parts[-2]
     else:
@@ -171,23 +256,15 @@ def parse_provider(url: str) -> str:
 
 def normalize_lines(tooltip: str) -> List[str]:
     tooltip = tooltip.replace("\\n", "\n")
-    lines: List[str] = []
-    for raw in tooltip.split("\n"):
-        line = " ".join(raw.split()).strip()
-        if line:
-            lines.append(line)
-    return lines
+    lines = (WHITESPACE_RE.sub(" ", raw).strip() for raw in tooltip.split("\n"))
+    return [line for line in lines if line]
 
 
 def extract_price(lines: List[str]) -> Tuple[str, int, str]:
     if not lines:
         return "Price not listed", 0, "estimated"
 
-    price_lines = [
-        line
-        for line in lines[1:]
-        if re.search(r"(\$|€|£|free|subscription|travel|member|exam)", line, flags=re.IGNORECASE)
-    ]
+    price_lines = [line for line in lines[1:] if PRICE_HINT_RE.search(line)]
 
     if not price_lines and len(lines) > 1:
         price_lines = [lines[1]]
@@ -196,7 +273,7 @@ def extract_price(lines: List[str]) -> Tuple[str, int, str]:
         return "Price not listed", 0, "estimated"
 
     label = " | ".join(price_lines[:2])
-    amount_match = re.search(r"\$\s*([0-9][0-9,]*(?:\.[0-9]+)?)", label)
+    amount_match = PRICE_AMOUNT_RE.search(label)
     amount = 0
     if amount_match:
         amount = int(float(amount_match.group(1).replace(",", "")))
@@ -226,52 +303,29 @@ def category_to_domain(main_cat: str, sub_cat: str | None) -> Tuple[str, List[st
 
 
 def infer_delivery(lines: List[str]) -> str:
-    text = " ".join(lines).lower()
-    if "interview" in text:
+    found = set(DELIVERY_RE.findall(" ".join(lines).lower()))
+    if "interview" in found:
         return "interview"
-    if "lab" in text and "exam" in text:
+    if "lab" in found and "exam" in found:
         return "exam+lab"
-    if "lab" in text:
+    if "lab" in found:
         return "lab"
-    if "course" in text and "exam" in text:
+    if "course" in found and "exam" in found:
         return "course+exam"
-    if "course" in text:
+    if "course" in found:
         return "course"
     return "exam"
 
 
 def infer_ai_focus(cert_code: str, title: str, summary: str, tags: List[str]) -> bool:
     text = f"{cert_code} {title} {summary} {' '.join(tags)}".lower()
-    keywords = [" ai", "machine learning", "ml ", "llm", "model", "iso42001", "iso/iec 42001", "aigp"]
-    return any(keyword in text for keyword in keywords)
+    return AI_KEYWORDS_RE.search(text) is not None
 
 
 def infer_tracks(area: str, sub_areas: List[str]) -> List[str]:
-    track_map = {
-        "Communication and Network Security": "communication-network-security",
-        "IAM": "iam",
-        "Security Architecture and Engineering": "security-architecture-and-engineering",
-        "Asset Security": "asset-security",
-        "Security and Risk Management": "security-and-risk-management",
-        "Security Assessment and Testing": "security-assessment-and-testing",
-        "Software Security": "software-security",
-        "Security Operations": "security-operations",
-    }
-
-    sub_track_map = {
-        "Cloud/SysOps": "cloud-sysops",
-        "*nix": "nix",
-        "ICS/IoT": "ics-iot",
-        "GRC": "grc",
-        "Forensics": "forensics",
-        "Incident Handling": "incident-handling",
-        "Penetration Testing": "penetration-testing",
-        "Exploitation": "exploitation",
-    }
-
-    tracks = [track_map.get(area, slugify(area))]
+    tracks = [TRACK_MAP.get(area) or slug_label(area)]
     for sub in sub_areas:
-        tracks.append(sub_track_map.get(sub, slugify(sub)))
+        tracks.append(SUB_TRACK_MAP.get(sub) or slug_label(sub))
     return sorted(set(tracks))
 
 
@@ -283,13 +337,13 @@ def infer_roles(area: str, sub_areas: List[str]) -> List[str]:
 
 
 def infer_tags(main_cat: str, sub_cat: str | None, adjacent: List[str], area: str, sub_areas: List[str]) -> List[str]:
-    tags = {slugify(main_cat), slugify(area)}
+    tags = {slug_label(main_cat), slug_label(area)}
     if sub_cat:
-        tags.add(slugify(sub_cat))
+        tags.add(slug_label(sub_cat))
     for sub in sub_areas:
-        tags.add(slugify(sub))
+        tags.add(slug_label(sub))
     for cat in adjacent:
-        tags.add(slugify(cat))
+        tags.add(slug_label(cat))
     return sorted(tags)
 
 
@@ -312,14 +366,14 @@ def infer_role_groups(main_cat: str, adjacent: List[str]) -> List[str]:
     return sorted(groups) if groups else ["Management"]
 
 
-def build_cert(record: Dict, used_ids: set[str]) -> Dict:
+def build_cert(record: Dict, used_ids: Dict[str, int]) -> Dict:
     tooltip_lines = normalize_lines(record.get("tooltiptext", ""))
     description = tooltip_lines[0] if tooltip_lines else record["content"]
     area, sub_areas = category_to_domain(record.get("mainCategory", ""), record.get("subCategory"))
     price_label, price_usd, price_confidence = extract_price(tooltip_lines)
 
     cert_id = unique_id(slugify(record["content"]), used_ids)
-    provider = parse_provider(record.get("href", ""))
+    provider = sys.intern(parse_provider(record.get("href", "")))
 
     tags = infer_tags(
         record.get("mainCategory", ""),
@@ -360,7 +414,7 @@ def build_cert(record: Dict, used_ids: set[str]) -> Dict:
     return cert
 
 
-def build_extra_ai_certs(used_ids: set[str]) -> List[Dict]:
+def build_extra_ai_certs(used_ids: Dict[str, int]) -> List[Dict]:
     extras = [
         {
             "id": "comptia-secai-plus",
@@ -568,9 +622,35 @@ def build_extra_ai_certs(used_ids: set[str]) -> List[Dict]:
     return output
 
 
-def write_yaml(cert: Dict, path: Path) -> None:
+def dump_yaml(data: Dict) -> bytes:
+    # let the emitter produce UTF-8 bytes directly instead of encoding a str afterwards
+    return yaml.dump(data, Dumper=YamlDumper, encoding="utf-8", sort_keys=False, allow_unicode=False)
+
+
+def dump_json(data: Dict, *, pretty: bool = True) -> bytes:
+    if orjson is not None:
+        if pretty:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        return orjson.dumps(data)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8") + b"\n"
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def write_file(path: Path, blob: bytes) -> None:
+    # one raw open/write/close per file, skipping Python's buffered file object
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(blob)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def ordered_cert(cert: Dict) -> Dict:
     # keep key order stable for maintainability
-    ordered = {
+    return {
         "id": cert["id"],
         "name": cert["name"],
         "provider": cert["provider"],
@@ -599,26 +679,67 @@ def write_yaml(cert: Dict, path: Path) -> None:
         "tooltip_legacy": cert["tooltip_legacy"],
     }
 
-    text = yaml.safe_dump(ordered, sort_keys=False, allow_unicode=False)
-    path.write_text(text, encoding="utf-8")
 
+SERIALIZERS = {"yaml": dump_yaml, "json": dump_json}
 
-def main() -> None:
-    source_data = json.loads(SOURCE_JSON.read_text(encoding="utf-8"))
-    TARGET_DIR.mkdir(parents=True, exist_ok=True)
 
-    for old in TARGET_DIR.glob("*.yaml"):
-        old.unlink()
+def write_cert(cert: Dict, path: Path, fmt: str) -> bool:
+    """Serialize one cert and write it only if the bytes on disk differ. Returns True when written."""
+    blob = SERIALIZERS[fmt](ordered_cert(cert))
+    try:
+        if path.stat().st_size == len(blob) and path.read_bytes() == blob:
+            return False
+    except FileNotFoundError:
+        pass
+    write_file(path, blob)
+    return True
+
+
+def iter_source_records() -> Iterator[Dict]:
+    # every record ends up in memory anyway, so orjson's one-shot parse beats streaming;
+    # ijson only helps when orjson is missing
+    if orjson is not None or ijson is None:
+        yield from (orjson or json).loads(SOURCE_JSON.read_bytes())
+        return
+    with SOURCE_JSON.open("rb") as handle:
+        yield from ijson.items(handle, "item", use_float=True)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--format",
+        choices=sorted(SERIALIZERS),
+        default="yaml",
+        help="file format for data/certifications entries (default: yaml)",
+    )
+    return parser.parse_args()
 
-    used_ids: set[str] = set()
-    certifications = [build_cert(record, used_ids) for record in source_data]
+
+def main() -> None:
+    args = parse_args()
+    used_ids: Dict[str, int] = {}
+    certifications = [build_cert(record, used_ids) for record in iter_source_records()]
     certifications.extend(build_extra_ai_certs(used_ids))
 
-    filenames: List[str] = []
-    for cert in certifications:
-        filename = f"{cert['id']}.yaml"
-        write_yaml(cert, TARGET_DIR / filename)
-        filenames.append(filename)
+    filenames = [f"{cert['id']}.{args.format}" for cert in certifications]
+    paths = [TARGET_DIR / filename for filename in filenames]
+    TARGET_DIR.mkdir(parents=True, exist_ok=True)
+    # each file is independent; spread serialization across cores
+    with ProcessPoolExecutor() as executor:
+        written = sum(executor.map(write_cert, certifications, paths, repeat(args.format), chunksize=16))
+
+    current = set(filenames)
+    stale = [path for pattern in ("*.yaml", "*.json") for path in TARGET_DIR.glob(pattern) if path.name not in current]
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(Path.unlink, stale))
+
+    # written after the cert files so rebuild_index.py can trust it by mtime
+    sidecar = {
+        filename: {"domain_area": cert["domain_area"], "sub_areas": cert["sub_areas"]}
+        for filename, cert in zip(filenames, certifications)
+    }
+    SIDECAR_FILE.write_bytes(dump_json(sidecar, pretty=False))
 
     index = {
         "catalog": "TheCyberCerts - Security Certification Roadmap",
@@ -648,8 +769,9 @@ def main() -> None:
         "certifications": sorted(filenames),
     }
 
-    INDEX_FILE.write_text(yaml.safe_dump(index, sort_keys=False, allow_unicode=False), encoding="utf-8")
+    INDEX_FILE.write_bytes(dump_yaml(index))
     print(f"Imported {len(certifications)} certifications into {TARGET_DIR}")
+    print(f"files written: {written}, unchanged: {len(certifications) - written}, removed: {len(stale)}")
 
 
 if __name__ == "__main__":
@@ -1,16 +1,32 @@
 #!/usr/bin/env python3
-"""Rebuild data/index.yaml from data/certifications/*.yaml (schema v2)."""
+"""Rebuild data/index.yaml from data/certifications/*.yaml or *.json (schema v2)."""
 
 from __future__ import annotations
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib json module
+    orjson = None
+
 ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT / "data"
 CERTS_DIR = DATA_DIR / "certifications"
 INDEX_PATH = DATA_DIR / "index.yaml"
+SIDECAR_PATH = DATA_DIR / "certifications.index.json"
+CERT_PATTERNS = ("*.yaml", "*.json")
 
 DOMAIN_ORDER = [
     "Communication and Network Security",
@@ -34,25 +50,120 @@ SUBAREA_ORDER = [
     "Exploitation",
 ]
 
+DOMAIN_ORDER_SET = frozenset(DOMAIN_ORDER)
+SUBAREA_ORDER_SET = frozenset(SUBAREA_ORDER)
+
+
+def scan_scalar(raw: bytes) -> str | None:
+    # only spaces are stripped, so tabs around a value leave it unrecognised and force the fallback
+    value = raw.strip(b" \r\n").decode("utf-8")
+    if value[:1] in ("*", "&", "!"):
+        # alias, anchor or tag; only the parser knows what it resolves to
+        return None
+    if len(value) > 1 and value[0] == value[-1] == "'":
+        value = value[1:-1]
+    return value
+
+
+def extract_domain_info(path: Path) -> tuple[str, list[str]] | None:
+    """Read domain_area and sub_areas from top-level lines without running the YAML parser.
+
+    Only a single document with plain or single-quoted values and "- item" lines at one
+    indentation is accepted. Returns None for anything else (missing or repeated keys,
+    unknown names, aliases/anchors/tags, tabs, blank lines, continuations, document
+    markers) so the caller can fall back to a full parse.
+    """
+    domain = None
+    sub_areas = None
+    item_indent = None
+    in_sub_areas = False
+    after_scanned_line = False
+    with path.open("rb") as handle:
+        for line in handle:
+            if line.startswith((b"---", b"...")):
+                # document marker; a second document or directives are for the parser
+                return None
+            item = line.lstrip(b" ")
+            if in_sub_areas and item.startswith(b"-"):
+                indent = len(line) - len(item)
+                if item_indent is None:
+                    item_indent = indent
+                # a bare "-", "-x" or an item at another indentation (folded continuation, nested list)
+                if not item.startswith(b"- ") or not item[2:].strip() or indent != item_indent:
+                    return None
+                sub_areas.append(scan_scalar(item[2:]))
+                continue
+            if after_scanned_line and (line[:1] in (b" ", b"\t", b"#") or not line.strip()):
+                # folded continuation, comment or blank line next to a scanned value; let the parser decide
+                return None
+            in_sub_areas = after_scanned_line = False
+            # keep reading to the end so a repeated key anywhere in the file forces the fallback
+            if line.startswith(b"domain_area:"):
+                if domain is not None:
+                    return None
+                domain = scan_scalar(line[len(b"domain_area:") :])
+                after_scanned_line = True
+            elif line.startswith(b"sub_areas:"):
+                if sub_areas is not None:
+                    return None
+                rest = line[len(b"sub_areas:") :].strip(b" \r\n")
+                if rest and rest != b"[]":
+                    return None
+                sub_areas = []
+                in_sub_areas = after_scanned_line = not rest
+
+    if domain not in DOMAIN_ORDER or sub_areas is None:
+        return None
+    if any(sub_area not in SUBAREA_ORDER for sub_area in sub_areas):
+        return None
+    return domain, sub_areas
+
+
+def load_cert(filename: str) -> dict:
+    path = CERTS_DIR / filename
+    if path.suffix == ".json":
+        return (orjson or json).loads(path.read_bytes())
+    info = extract_domain_info(path)
+    if info is None:
+        return yaml.load(path.read_bytes(), Loader=YamlLoader)
+    domain, sub_areas = info
+    return {"domain_area": domain, "sub_areas": sub_areas}
+
+
+def load_sidecar(files: list[str]) -> list[dict] | None:
+    """Return domain info from the importer's JSON sidecar, or None if it is missing or stale."""
+    if not SIDECAR_PATH.exists():
+        return None
+    sidecar_mtime = SIDECAR_PATH.stat().st_mtime_ns
+    if CERTS_DIR.stat().st_mtime_ns > sidecar_mtime:
+        return None
+    if any((CERTS_DIR / filename).stat().st_mtime_ns > sidecar_mtime for filename in files):
+        return None
+    entries = (orjson or json).loads(SIDECAR_PATH.read_bytes())
+    if not isinstance(entries, dict) or sorted(entries) != files:
+        return None
+    return [entries[filename] for filename in files]
+
 
 def main() -> None:
-    files = sorted(path.name for path in CERTS_DIR.glob("*.yaml"))
-    existing_index = yaml.safe_load(INDEX_PATH.read_text(encoding="utf-8")) if INDEX_PATH.exists() else {}
+    files = sorted(path.name for pattern in CERT_PATTERNS for path in CERTS_DIR.glob(pattern))
+    existing_index = yaml.load(INDEX_PATH.read_bytes(), Loader=YamlLoader) if INDEX_PATH.exists() else {}
     if not isinstance(existing_index, dict):
         existing_index = {}
 
-    domains = set()
-    sub_areas = set()
+    payloads = load_sidecar(files)
+    if payloads is None:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            payloads = list(executor.map(load_cert, files))
 
-    for filename in files:
-        payload = yaml.safe_load((CERTS_DIR / filename).read_text(encoding="utf-8"))
-        domains.add(payload.get("domain_area", "Security Operations"))
-        for sub in payload.get("sub_areas", []) or []:
-            sub_areas.add(sub)
+    domains = dict.fromkeys(payload.get("domain_area", "Security Operations") for payload in payloads)
+    sub_areas = dict.fromkeys(sub for payload in payloads for sub in payload.get("sub_areas", []) or [])
 
-    ordered_domains = [domain for domain in DOMAIN_ORDER if domain in domains] + sorted(domains - set(DOMAIN_ORDER))
+    ordered_domains = [domain for domain in DOMAIN_ORDER if domain in domains] + sorted(
+        domain for domain in domains if domain not in DOMAIN_ORDER_SET
+    )
     ordered_sub_areas = [sub_area for sub_area in SUBAREA_ORDER if sub_area in sub_areas] + sorted(
-        sub_areas - set(SUBAREA_ORDER)
+        sub_area for sub_area in sub_areas if sub_area not in SUBAREA_ORDER_SET
     )
 
     index = {
@@ -83,7 +194,7 @@ def main() -> None:
         "certifications": files,
     }
 
-    INDEX_PATH.write_text(yaml.safe_dump(index, sort_keys=False, allow_unicode=False), encoding="utf-8")
+    INDEX_PATH.write_text(yaml.dump(index, Dumper=YamlDumper, sort_keys=False, allow_unicode=False), encoding="utf-8")
     print(f"index rebuilt: {INDEX_PATH}")
     print(f"certifications indexed: {len(files)}")
 
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Regression checks for the rebuild_index.py line scanner; run with python -m unittest discover -s scripts."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+from rebuild_index import extract_domain_info
+
+# each document must either scan to what yaml.safe_load returns or make the scanner give up
+CASES = {
+    "block list": "domain_area: Security Operations\nsub_areas:\n- Forensics\n- Exploitation\n",
+    "empty list": "domain_area: IAM\nsub_areas: []\n",
+    "blank line before first item": "domain_area: Security Operations\nsub_areas:\n\n- Forensics\n",
+    "blank line between items": "domain_area: Security Operations\nsub_areas:\n- Forensics\n\n- Exploitation\n",
+    "blank line after domain": "domain_area: Security\n\n  Operations\nsub_areas: []\n",
+    "repeated domain_area": "domain_area: IAM\nsub_areas: []\ndomain_area: Security Operations\n",
+    "repeated sub_areas": "domain_area: Security Operations\nsub_areas: []\nsub_areas:\n- Forensics\n",
+    "item after bare dash": "domain_area: Security Operations\nsub_areas:\n-\n  Forensics\n",
+    "folded item continuation": "domain_area: Security Operations\nsub_areas:\n- Forensics\n  - Exploitation\n",
+    "alias item": "domain_area: Security Architecture and Engineering\nsub_areas:\n- *nix\n",
+    "tab after domain_area": "domain_area:\tIAM\nsub_areas: []\n",
+    "tab after sub_areas": "domain_area: IAM\nsub_areas:\t[]\n",
+    "second document": "domain_area: IAM\nsub_areas: []\n---\ndomain_area: Security Operations\n",
+}
+# valid YAML the scanner would misread, or documents the parser rejects
+FALLBACK = [label for label in CASES if label not in ("block list", "empty list", "blank line after domain")]
+
+
+class ExtractDomainInfoTest(unittest.TestCase):
+    def test_scanner_agrees_with_yaml(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            for label, text in CASES.items():
+                with self.subTest(label):
+                    path = Path(tmp) / "cert.yaml"
+                    path.write_text(text, encoding="utf-8")
+                    info = extract_domain_info(path)
+                    if info is None:
+                        continue
+                    payload = yaml.safe_load(text)
+                    self.assertEqual(info, (payload["domain_area"], payload["sub_areas"]))
+
+    def test_unusual_documents_fall_back(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            for label in FALLBACK:
+                with self.subTest(label):
+                    path = Path(tmp) / "cert.yaml"
+                    path.write_text(CASES[label], encoding="utf-8")
+                    self.assertIsNone(extract_domain_info(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,154 +1,265 @@
 #!/usr/bin/env python3
-"""Validate catalog YAML files for required v2 fields."""
+"""Validate catalog YAML or JSON files for required v2 fields."""
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import multiprocessing
 import re
 import sys
 from datetime import date
 from pathlib import Path
+from types import MappingProxyType
+from typing import Annotated, Any, Literal
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib json module
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional; every field check then runs in Python
+    msgspec = None
+
 ROOT = Path(__file__).resolve().parent.parent
 CERTS_DIR = ROOT / "data" / "certifications"
-
-VALID_LEVELS = {"foundational", "intermediate", "advanced", "expert"}
-VALID_STATUS = {"active", "beta", "retired"}
-VALID_PRICE_CONFIDENCE = {"from-original-tooltip", "estimated"}
-VALID_DOMAINS = {
-    "Communication and Network Security",
-    "IAM",
-    "Security Architecture and Engineering",
-    "Asset Security",
-    "Security and Risk Management",
-    "Security Assessment and Testing",
-    "Software Security",
-    "Security Operations",
-}
-VALID_SUB_AREAS = {
-    "Cloud/SysOps",
-    "*nix",
-    "ICS/IoT",
-    "GRC",
-    "Forensics",
-    "Incident Handling",
-    "Penetration Testing",
-    "Exploitation",
-}
-VALID_ROLE_GROUPS = {
-    "Network",
-    "Asset",
-    "Engineer",
-    "Management",
-    "Testing",
-    "Software",
-    "Blue Team Ops",
-    "Red Team Ops",
-    "IAM",
-}
-DOMAIN_SUBAREA_MAP = {
-    "Communication and Network Security": set(),
-    "IAM": set(),
-    "Security Architecture and Engineering": {"Cloud/SysOps", "*nix", "ICS/IoT"},
-    "Asset Security": set(),
-    "Security and Risk Management": {"GRC"},
-    "Security Assessment and Testing": set(),
-    "Software Security": set(),
-    "Security Operations": {
+CACHE_PATH = ROOT / ".cache" / "validate_catalog.json"
+CERT_PATTERNS = ("*.yaml", "*.json")
+
+VALID_LEVELS = frozenset({"foundational", "intermediate", "advanced", "expert"})
+VALID_STATUS = frozenset({"active", "beta", "retired"})
+VALID_PRICE_CONFIDENCE = frozenset({"from-original-tooltip", "estimated"})
+VALID_DOMAINS = frozenset(
+    {
+        "Communication and Network Security",
+        "IAM",
+        "Security Architecture and Engineering",
+        "Asset Security",
+        "Security and Risk Management",
+        "Security Assessment and Testing",
+        "Software Security",
+        "Security Operations",
+    }
+)
+VALID_SUB_AREAS = frozenset(
+    {
+        "Cloud/SysOps",
+        "*nix",
+        "ICS/IoT",
+        "GRC",
         "Forensics",
         "Incident Handling",
         "Penetration Testing",
         "Exploitation",
-    },
-}
-UNKNOWN_PRICE_LABEL_HINTS = {
-    "not listed",
-    "unknown",
-    "tbd",
-    "see provider",
-    "n/a",
-    "varies",
-}
-URL_RE = re.compile(r"^https?://")
-ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-
-REQUIRED_KEYS = {
-    "id",
-    "name",
-    "provider",
-    "cert_code",
-    "url",
-    "domain_area",
-    "sub_areas",
-    "tracks",
-    "level",
-    "status",
-    "ai_focus",
-    "introduced_year",
-    "last_updated",
-    "delivery",
-    "renewal",
-    "language",
-    "role_groups",
-    "roles",
-    "tags",
-    "prerequisites",
-    "description",
-    "summary",
-    "price_usd",
-    "price_label",
-    "price_confidence",
-    "tooltip_legacy",
-}
+    }
+)
+VALID_ROLE_GROUPS = frozenset(
+    {
+        "Network",
+        "Asset",
+        "Engineer",
+        "Management",
+        "Testing",
+        "Software",
+        "Blue Team Ops",
+        "Red Team Ops",
+        "IAM",
+    }
+)
+DOMAIN_SUBAREA_MAP = MappingProxyType(
+    {
+        "Communication and Network Security": frozenset(),
+        "IAM": frozenset(),
+        "Security Architecture and Engineering": frozenset({"Cloud/SysOps", "*nix", "ICS/IoT"}),
+        "Asset Security": frozenset(),
+        "Security and Risk Management": frozenset({"GRC"}),
+        "Security Assessment and Testing": frozenset(),
+        "Software Security": frozenset(),
+        "Security Operations": frozenset(
+            {
+                "Forensics",
+                "Incident Handling",
+                "Penetration Testing",
+                "Exploitation",
+            }
+        ),
+    }
+)
+UNKNOWN_PRICE_LABEL_HINTS = frozenset(
+    {
+        "not listed",
+        "unknown",
+        "tbd",
+        "see provider",
+        "n/a",
+        "varies",
+    }
+)
+DIGIT_RE = re.compile(r"\d")
+# a zero price is fine when the label says it is unknown or free
+UNKNOWN_OR_FREE_RE = re.compile("|".join(re.escape(hint) for hint in sorted(UNKNOWN_PRICE_LABEL_HINTS | {"free"})))
+
+REQUIRED_KEYS = frozenset(
+    {
+        "id",
+        "name",
+        "provider",
+        "cert_code",
+        "url",
+        "domain_area",
+        "sub_areas",
+        "tracks",
+        "level",
+        "status",
+        "ai_focus",
+        "introduced_year",
+        "last_updated",
+        "delivery",
+        "renewal",
+        "language",
+        "role_groups",
+        "roles",
+        "tags",
+        "prerequisites",
+        "description",
+        "summary",
+        "price_usd",
+        "price_label",
+        "price_confidence",
+        "tooltip_legacy",
+    }
+)
+
+# keys the semantic checks in validate_one depend on; if any is absent only the missing-keys error is reported
+STRUCTURAL_KEYS = frozenset(
+    {
+        "domain_area",
+        "sub_areas",
+        "role_groups",
+        "price_usd",
+        "price_label",
+        "url",
+        "last_updated",
+        "tooltip_legacy",
+        "description",
+        "summary",
+    }
+)
+
+if msgspec is not None:
+
+    class CertFields(msgspec.Struct):
+        """Per-field type and enum rules; each is at least as strict as its Python check in validate_one."""
+
+        id: Any
+        name: Any
+        provider: Any
+        cert_code: Any
+        url: Any
+        domain_area: Literal[tuple(sorted(VALID_DOMAINS))]
+        sub_areas: list[Literal[tuple(sorted(VALID_SUB_AREAS))]]
+        tracks: Any
+        level: Literal[tuple(sorted(VALID_LEVELS))]
+        status: Literal[tuple(sorted(VALID_STATUS))]
+        ai_focus: bool
+        introduced_year: int
+        last_updated: Any
+        delivery: Any
+        renewal: Any
+        language: Any
+        role_groups: Annotated[list[Literal[tuple(sorted(VALID_ROLE_GROUPS))]], msgspec.Meta(min_length=1)]
+        roles: Any
+        tags: Any
+        prerequisites: Any
+        description: Any
+        summary: Any
+        price_usd: Annotated[int, msgspec.Meta(ge=0)]
+        price_label: Any
+        price_confidence: Literal[tuple(sorted(VALID_PRICE_CONFIDENCE))]
+        tooltip_legacy: Any
 
 
 def fail(message: str, errors: list[str]) -> None:
     errors.append(message)
 
 
-def main() -> int:
-    files = sorted(CERTS_DIR.glob("*.yaml"))
-    errors: list[str] = []
-
-    if not files:
-        fail("No YAML files found in data/certifications", errors)
-
-    seen_ids: set[str] = set()
-
-    for path in files:
-        payload = yaml.safe_load(path.read_text(encoding="utf-8"))
-        if not isinstance(payload, dict):
-            fail(f"{path.name}: must contain a YAML object", errors)
-            continue
-
-        missing = sorted(REQUIRED_KEYS - set(payload.keys()))
-        if missing:
-            fail(f"{path.name}: missing keys {', '.join(missing)}", errors)
-
-        file_id = path.stem
-        cert_id = str(payload.get("id", ""))
-        if cert_id != file_id:
-            fail(f"{path.name}: id '{cert_id}' must match filename '{file_id}'", errors)
+def stripped_text(value: object) -> str:
+    # YAML strings arrive as str already; only other scalars need converting
+    if isinstance(value, str):
+        return value.strip()
+    if value is None:
+        return ""
+    return str(value).strip()
 
-        if cert_id in seen_ids:
-            fail(f"{path.name}: duplicate id '{cert_id}'", errors)
-        seen_ids.add(cert_id)
-
-        if payload.get("domain_area") not in VALID_DOMAINS:
-            fail(f"{path.name}: invalid domain_area '{payload.get('domain_area')}'", errors)
 
-        sub_areas = payload.get("sub_areas")
-        if not isinstance(sub_areas, list):
-            fail(f"{path.name}: sub_areas must be a list", errors)
-        else:
+def validate_one(path: Path) -> tuple[str | None, list[str]]:
+    """Validate a single catalog file; returns its id (None if unreadable) and its errors."""
+    errors: list[str] = []
+    if path.suffix == ".json":
+        # catalogs written with import_from_original.py --format json skip the YAML parser entirely
+        payload = (orjson or json).loads(path.read_bytes())
+        kind = "JSON"
+    else:
+        with path.open("rb") as handle:
+            payload = yaml.load(handle, Loader=YamlLoader)
+        kind = "YAML"
+    if not isinstance(payload, dict):
+        fail(f"{path.name}: must contain a {kind} object", errors)
+        return None, errors
+
+    missing = REQUIRED_KEYS.difference(payload)
+    if missing:
+        fail(f"{path.name}: missing keys {', '.join(sorted(missing))}", errors)
+        if not STRUCTURAL_KEYS.isdisjoint(missing):
+            # the remaining checks would only repeat the missing keys as follow-on errors
+            return None, errors
+
+    domain = payload.get("domain_area")
+    sub_areas = payload.get("sub_areas")
+    role_groups = payload.get("role_groups")
+    level = payload.get("level")
+    status = payload.get("status")
+    price_usd_raw = payload.get("price_usd")
+
+    fields_ok = False
+    if msgspec is not None and not missing:
+        try:
+            msgspec.convert(payload, CertFields)
+            fields_ok = True
+        except msgspec.ValidationError:
+            pass  # run the Python field checks so every problem is reported in the usual wording
+
+    file_id = path.stem
+    cert_id = str(payload.get("id", ""))
+    if cert_id != file_id:
+        fail(f"{path.name}: id '{cert_id}' must match filename '{file_id}'", errors)
+
+    if not fields_ok and domain not in VALID_DOMAINS:
+        fail(f"{path.name}: invalid domain_area '{domain}'", errors)
+
+    if not isinstance(sub_areas, list):
+        fail(f"{path.name}: sub_areas must be a list", errors)
+    else:
+        # subset tests cover the common all-valid case; only walk the list to report offenders in order
+        sub_area_set = set(sub_areas)
+        if not fields_ok and not sub_area_set <= VALID_SUB_AREAS:
             for sub_area in sub_areas:
                 if sub_area not in VALID_SUB_AREAS:
                     fail(f"{path.name}: invalid sub_area '{sub_area}'", errors)
 
-            domain = payload.get("domain_area")
-            allowed_sub_areas = DOMAIN_SUBAREA_MAP.get(domain, set())
-            if allowed_sub_areas:
+        allowed_sub_areas = DOMAIN_SUBAREA_MAP.get(domain, frozenset())
+        if allowed_sub_areas:
+            if not sub_area_set <= allowed_sub_areas:
                 for sub_area in sub_areas:
                     if sub_area not in allowed_sub_areas:
                         fail(
@@ -158,16 +269,16 @@ def main() -> int:
                             ),
                             errors,
                         )
-            elif sub_areas:
-                fail(
-                    (
-                        f"{path.name}: domain_area '{domain}' does not define sub-areas, "
-                        "so sub_areas must be empty"
-                    ),
-                    errors,
-                )
-
-        role_groups = payload.get("role_groups")
+        elif sub_areas:
+            fail(
+                (
+                    f"{path.name}: domain_area '{domain}' does not define sub-areas, "
+                    "so sub_areas must be empty"
+                ),
+                errors,
+            )
+
+    if not fields_ok:
         if not isinstance(role_groups, list) or not role_groups:
             fail(f"{path.name}: role_groups must be a non-empty list", errors)
         else:
@@ -175,11 +286,11 @@ def main() -> int:
                 if role_group not in VALID_ROLE_GROUPS:
                     fail(f"{path.name}: invalid role_group '{role_group}'", errors)
 
-        if payload.get("level") not in VALID_LEVELS:
-            fail(f"{path.name}: invalid level '{payload.get('level')}'", errors)
+        if level not in VALID_LEVELS:
+            fail(f"{path.name}: invalid level '{level}'", errors)
 
-        if payload.get("status") not in VALID_STATUS:
-            fail(f"{path.name}: invalid status '{payload.get('status')}'", errors)
+        if status not in VALID_STATUS:
+            fail(f"{path.name}: invalid status '{status}'", errors)
 
         if not isinstance(payload.get("ai_focus"), bool):
             fail(f"{path.name}: ai_focus must be boolean", errors)
@@ -187,90 +298,175 @@ def main() -> int:
         if not isinstance(payload.get("introduced_year"), int):
             fail(f"{path.name}: introduced_year must be integer", errors)
 
-        if not isinstance(payload.get("price_usd"), int):
+        if not isinstance(price_usd_raw, int):
             fail(f"{path.name}: price_usd must be integer", errors)
-        elif int(payload.get("price_usd")) < 0:
+        elif price_usd_raw < 0:
             fail(f"{path.name}: price_usd must be >= 0", errors)
 
-        description = str(payload.get("description", "")).strip()
-        if not description:
-            fail(f"{path.name}: description must not be empty", errors)
+    description = stripped_text(payload.get("description"))
+    if not description:
+        fail(f"{path.name}: description must not be empty", errors)
+
+    price_label = stripped_text(payload.get("price_label"))
+    if not price_label:
+        fail(f"{path.name}: price_label must not be empty", errors)
+
+    price_confidence = str(payload.get("price_confidence", ""))
+    if not fields_ok and price_confidence not in VALID_PRICE_CONFIDENCE:
+        fail(
+            (
+                f"{path.name}: price_confidence '{price_confidence}' must be one of "
+                f"{', '.join(sorted(VALID_PRICE_CONFIDENCE))}"
+            ),
+            errors,
+        )
+
+    url = stripped_text(payload.get("url"))
+    if not url.startswith(("http://", "https://")):
+        fail(f"{path.name}: url must start with http:// or https://", errors)
+
+    last_updated = stripped_text(payload.get("last_updated"))
+    # date.fromisoformat also accepts forms like 20260227 or 2026-W09-5, so check the shape first
+    if not (
+        len(last_updated) == 10
+        and last_updated[4] == last_updated[7] == "-"
+        and (last_updated[:4] + last_updated[5:7] + last_updated[8:]).isdecimal()
+    ):
+        fail(f"{path.name}: last_updated must use YYYY-MM-DD", errors)
+    else:
+        try:
+            date.fromisoformat(last_updated)
+        except ValueError:
+            fail(f"{path.name}: last_updated is not a valid calendar date", errors)
+
+    summary = stripped_text(payload.get("summary"))
+    if not summary:
+        fail(f"{path.name}: summary must not be empty", errors)
+
+    tooltip_legacy = stripped_text(payload.get("tooltip_legacy"))
+    name = stripped_text(payload.get("name"))
+    cert_code = stripped_text(payload.get("cert_code"))
+    if not tooltip_legacy:
+        fail(f"{path.name}: tooltip_legacy must not be empty", errors)
+    else:
+        needles = tuple(text.lower() for text in (name, cert_code, description) if text)
+        tooltip_lower = tooltip_legacy.lower() if needles else ""
+        if not any(needle in tooltip_lower for needle in needles):
+            fail(
+                f"{path.name}: tooltip_legacy should contain name, cert_code, or description",
+                errors,
+            )
+
+    if not isinstance(price_usd_raw, int):
+        # already reported as "price_usd must be integer"; price/label coherence would only add noise
+        return cert_id, errors
 
-        price_label = str(payload.get("price_label", "")).strip()
-        if not price_label:
-            fail(f"{path.name}: price_label must not be empty", errors)
+    price_usd = price_usd_raw
+    price_label_lower = price_label.lower()
+    has_digit = DIGIT_RE.search(price_label_lower) is not None
 
-        price_confidence = str(payload.get("price_confidence", ""))
-        if price_confidence not in VALID_PRICE_CONFIDENCE:
+    if price_usd == 0 and (has_digit or "$" in price_label_lower):
+        if not UNKNOWN_OR_FREE_RE.search(price_label_lower):
             fail(
                 (
-                    f"{path.name}: price_confidence '{price_confidence}' must be one of "
-                    f"{', '.join(sorted(VALID_PRICE_CONFIDENCE))}"
+                    f"{path.name}: price_usd is 0 but price_label looks numeric; "
+                    "set a numeric price_usd or use an unknown/free label"
                 ),
                 errors,
             )
 
-        url = str(payload.get("url", "")).strip()
-        if not URL_RE.match(url):
-            fail(f"{path.name}: url must start with http:// or https://", errors)
+    if price_usd > 0 and not has_digit:
+        fail(
+            f"{path.name}: price_usd is > 0 but price_label has no numeric hint",
+            errors,
+        )
 
-        last_updated = str(payload.get("last_updated", "")).strip()
-        if not ISO_DATE_RE.match(last_updated):
-            fail(f"{path.name}: last_updated must use YYYY-MM-DD", errors)
-        else:
-            try:
-                date.fromisoformat(last_updated)
-            except ValueError:
-                fail(f"{path.name}: last_updated is not a valid calendar date", errors)
-
-        summary = str(payload.get("summary", "")).strip()
-        if not summary:
-            fail(f"{path.name}: summary must not be empty", errors)
-
-        tooltip_legacy = str(payload.get("tooltip_legacy", "")).strip()
-        name = str(payload.get("name", "")).strip()
-        cert_code = str(payload.get("cert_code", "")).strip()
-        description_text = str(payload.get("description", "")).strip()
-        if not tooltip_legacy:
-            fail(f"{path.name}: tooltip_legacy must not be empty", errors)
-        else:
-            tooltip_lower = tooltip_legacy.lower()
-            name_match = bool(name) and name.lower() in tooltip_lower
-            code_match = bool(cert_code) and cert_code.lower() in tooltip_lower
-            description_match = bool(description_text) and description_text.lower() in tooltip_lower
-            if not name_match and not code_match and not description_match:
-                fail(
-                    f"{path.name}: tooltip_legacy should contain name, cert_code, or description",
-                    errors,
-                )
-
-        price_usd = int(payload.get("price_usd", 0))
-        price_label_lower = price_label.lower()
-        label_has_number_or_dollar = bool(re.search(r"\d", price_label)) or "$" in price_label
-
-        if price_usd == 0 and label_has_number_or_dollar:
-            if not any(marker in price_label_lower for marker in UNKNOWN_PRICE_LABEL_HINTS) and "free" not in price_label_lower:
-                fail(
-                    (
-                        f"{path.name}: price_usd is 0 but price_label looks numeric; "
-                        "set a numeric price_usd or use an unknown/free label"
-                    ),
-                    errors,
-                )
-
-        if price_usd > 0 and not re.search(r"\d", price_label):
-            fail(
-                f"{path.name}: price_usd is > 0 but price_label has no numeric hint",
-                errors,
-            )
+    if "free" in price_label_lower and price_usd != 0:
+        fail(f"{path.name}: price_label says free but price_usd is not 0", errors)
+
+    return cert_id, errors
+
+
+def load_cache(fingerprint: str) -> dict:
+    """Return cached per-file results, or an empty dict if the cache is missing or from another validator version."""
+    try:
+        cache = json.loads(CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("validator") != fingerprint:
+        return {}
+    entries = cache.get("files")
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_cache(fingerprint: str, entries: dict) -> None:
+    """Store per-file results; a cache that cannot be written (e.g. read-only checkout) is skipped."""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_text(json.dumps({"validator": fingerprint, "files": entries}), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="re-validate every file and leave .cache/validate_catalog.json untouched",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    files = sorted(path for pattern in CERT_PATTERNS for path in CERTS_DIR.glob(pattern))
+    errors: list[str] = []
+
+    if not files:
+        fail("No YAML or JSON files found in data/certifications", errors)
+
+    seen_ids: set[str] = set()
+
+    # files that passed last time and are untouched since (same mtime and size) are not re-parsed;
+    # any change to this script invalidates the whole cache
+    fingerprint = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    cached = {} if args.no_cache else load_cache(fingerprint)
+    stats = {path: path.stat() for path in files}
+    fresh: dict[Path, str] = {}
+    for path in files:
+        entry = cached.get(path.name)
+        if (
+            isinstance(entry, dict)
+            and entry.get("mtime_ns") == stats[path].st_mtime_ns
+            and entry.get("size") == stats[path].st_size
+        ):
+            fresh[path] = entry.get("id")
+    pending = [path for path in files if path not in fresh]
+
+    # files are independent; cross-file checks (duplicate ids) run in the parent
+    results: dict[Path, tuple[str | None, list[str]]] = {}
+    if pending:
+        with multiprocessing.Pool() as pool:
+            results = dict(zip(pending, pool.map(validate_one, pending, chunksize=8)))
+
+    entries: dict[str, dict] = {}
+    for path in files:
+        cert_id, file_errors = results[path] if path in results else (fresh[path], [])
+        errors.extend(file_errors)
+        if cert_id is None:
+            continue
+        if not file_errors:
+            entries[path.name] = {"mtime_ns": stats[path].st_mtime_ns, "size": stats[path].st_size, "id": cert_id}
+        if cert_id in seen_ids:
+            fail(f"{path.name}: duplicate id '{cert_id}'", errors)
+        seen_ids.add(cert_id)
 
-        if "free" in price_label_lower and price_usd != 0:
-            fail(f"{path.name}: price_label says free but price_usd is not 0", errors)
+    if not args.no_cache:
+        save_cache(fingerprint, entries)
 
     if errors:
-        print("Catalog validation failed:")
-        for message in errors:
-            print(f"- {message}")
+        sys.stdout.write("Catalog validation failed:\n" + "".join(f"- {message}\n" for message in errors))
         return 1
 
     print(f"Catalog validation passed for {len(files)} file(s).")